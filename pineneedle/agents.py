@@ -1,47 +1,161 @@
 """Pydantic-AI agents for Pineneedle."""
 
+import asyncio
+import atexit
+import functools
+import itertools
+import json
 import os
+import re
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Final
 
-import logfire
-from dotenv import load_dotenv
+import httpx
+import pydantic_core
 from pydantic_ai import Agent, ModelRetry, RunContext
+from pydantic_ai.messages import PartDeltaEvent, PartStartEvent, ToolCallPart, ToolCallPartDelta
+from pydantic_ai.models import Model
 
+from .environment import load_environment
 from .models import (
     JobPosting,
     JobPostingContent,
     ModelConfig,
     ResumeContent,
     ResumeDeps,
-    UserBackground,
+    TemplateSchema,
 )
 
 # Load environment variables at module import
-load_dotenv()
+load_environment()
 
-# Configure logfire for local file logging only
-from pathlib import Path
-logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
-logfire.configure(
-    send_to_logfire=False,
-    console=False
-)
-logfire.instrument_pydantic_ai()
+# Logfire observability is opt-in; when disabled the log helpers are no-ops, and every
+# call site is guarded by _LOG_ENABLED so its arguments aren't built either
+_LOG_ENABLED = os.getenv("PINENEEDLE_LOGFIRE", "0") == "1"
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Discard a log call."""
+
+if _LOG_ENABLED:
+    import logfire
+    
+    # Configure logfire for local file logging only
+    logs_dir = Path("logs")
+    logs_dir.mkdir(exist_ok=True)
+    logfire.configure(
+        send_to_logfire=False,
+        console=False
+    )
+    logfire.instrument_pydantic_ai()
+    
+    _log_info = logfire.info
+    _log_warning = logfire.warning
+else:
+    _log_info = _log_warning = _noop
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all provider models."""
+    return httpx.AsyncClient(
+        http2=True,  # Multiplex concurrent requests over one connection per provider
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("PINENEEDLE_MAX_CONN", "1000")),
+            max_keepalive_connections=500,
+            keepalive_expiry=60.0,
+        ),
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
 
-def create_model_string(config: ModelConfig) -> str:
-    """Create model string for pydantic-ai from config."""
-    return f"{config.provider}:{config.model_name}"
 
+@functools.lru_cache(maxsize=1)
+def _get_runner() -> asyncio.Runner:
+    """Return the long-lived event loop runner shared by synchronous callers.
+    
+    Uses uvloop when it is installed (the `fast` extra).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.Runner()
+    return asyncio.Runner(loop_factory=uvloop.new_event_loop)
+
+
+def run_sync(coro):
+    """Run a coroutine on the shared event loop.
+    
+    Unlike asyncio.run, the loop stays up between calls, so pooled HTTP
+    connections (which are bound to the loop that opened them) keep being reused.
+    """
+    return _get_runner().run(coro)
+
+
+@atexit.register
+def _close_http_client() -> None:
+    """Close the shared HTTP client and event loop if they were ever created."""
+    has_runner = bool(_get_runner.cache_info().currsize)
+    if _get_http_client.cache_info().currsize:
+        try:
+            if has_runner:
+                _get_runner().run(_get_http_client().aclose())
+            else:
+                asyncio.run(_get_http_client().aclose())
+        except Exception:
+            pass  # Connections may belong to an already-closed event loop
+    if has_runner:
+        _get_runner().close()
+
+
+@functools.lru_cache
+def _build_model(provider: str, model_name: str) -> Model | str:
+    """Build a model backed by the shared HTTP client.
+    
+    Providers without a dedicated client fall back to a pydantic-ai model string.
+    """
+    if provider == "openai":
+        from pydantic_ai.models.openai import OpenAIModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+        return OpenAIModel(model_name, provider=OpenAIProvider(http_client=_get_http_client()))
+    if provider == "anthropic":
+        from pydantic_ai.providers.anthropic import AnthropicProvider
+        return _cached_anthropic_model_class()(model_name, provider=AnthropicProvider(http_client=_get_http_client()))
+    return create_model_string(provider, model_name)
+
+@functools.lru_cache(maxsize=1)
+def _cached_anthropic_model_class() -> type[Model]:
+    """Get an AnthropicModel subclass that marks the system prompt for prompt caching.
+    
+    OpenAI caches long stable prefixes automatically; Anthropic needs an explicit
+    cache_control breakpoint, so the static system prompt is sent as a cacheable block.
+    """
+    from pydantic_ai.models.anthropic import AnthropicModel
+    
+    class CachedSystemPromptAnthropicModel(AnthropicModel):
+        # Forward whatever the installed pydantic-ai passes; the signature has grown across releases
+        async def _map_message(self, messages, *args, **kwargs):
+            system_prompt, anthropic_messages = await super()._map_message(messages, *args, **kwargs)
+            # Newer releases may already return content blocks; only wrap a plain string
+            if system_prompt and isinstance(system_prompt, str):
+                system_prompt = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            return system_prompt, anthropic_messages
+    
+    return CachedSystemPromptAnthropicModel
+
+@functools.lru_cache(maxsize=32)
+def create_model_string(provider: str, model_name: str) -> str:
+    """Create model string for pydantic-ai from provider and model name."""
+    return f"{provider}:{model_name}"
+
+@functools.lru_cache(maxsize=1)
 def get_default_model_string() -> str:
     """Get default model string from environment variables."""
     provider = os.getenv("PINENEEDLE_DEFAULT_PROVIDER", "openai")
     model_name = os.getenv("PINENEEDLE_DEFAULT_MODEL", "gpt-4o")
-    return f"{provider}:{model_name}"
+    return create_model_string(provider, model_name)
 
-# System prompts
-JOB_PARSER_SYSTEM_PROMPT = """You are an expert at parsing job postings and extracting comprehensive structured information for resume optimization.
+# System prompts - kept static so providers can cache them as a shared request prefix
+JOB_PARSER_SYSTEM_PROMPT: Final = """You are an expert at parsing job postings and extracting comprehensive structured information for resume optimization.
 
 Your task is to analyze the raw job posting content and extract:
 
@@ -65,7 +179,7 @@ Guidelines:
 - For industry classification, be specific but concise
 - For practical description, strip away ALL corporate speak and buzzwords - describe the actual work in plain English as if explaining to a friend what you'd be doing at your desk each day"""
 
-RESUME_GENERATOR_SYSTEM_PROMPT = """You are an expert resume writer who creates tailored resumes for specific job postings.
+RESUME_GENERATOR_SYSTEM_PROMPT: Final = """You are an expert resume writer who creates tailored resumes for specific job postings.
 
 Your task is to generate a professional resume that:
 1. Follows the template structure exactly as defined in the template schema
@@ -76,7 +190,7 @@ Your task is to generate a professional resume that:
 6. Uses strong action verbs and quantifiable achievements where possible
 
 CRITICAL INSTRUCTIONS:
-- Use the get_template_structure tool to understand the exact template format and requirements
+- Use the template structure in the provided <CONTEXT> block (or the get_template_structure tool) to understand the exact template format and requirements
 - Each required section must be present with the specified format (e.g., "## Summary", "## Experience")
 - Ensure each section meets the minimum length requirements defined in the schema
 - Follow the placeholder structure exactly as shown in the template content
@@ -112,131 +226,120 @@ resume_generator = Agent(
     retries=3
 )
 
-# Tools for resume generator
+def _serialize_deps(deps: ResumeDeps) -> str:
+    """Render all generation context as one markdown block for the initial prompt."""
+    return "\n\n".join([
+        "## User Background\n" + json.dumps(deps.user_background_data, indent=2),
+        "## Job Requirements\n" + json.dumps(deps.job_requirements, indent=2),
+        "## Tone Guidance\n" + deps.tone_guidance,
+        "## Feedback\n" + deps.feedback_context,
+        "## Template Structure\n" + json.dumps(deps.template_structure, indent=2),
+    ])
+
+
+# Tools for resume generator - the same context is inlined in the prompt, these remain as a fallback
 @resume_generator.tool
-async def load_user_background(ctx: RunContext[ResumeDeps]) -> UserBackground:
+async def load_user_background(ctx: RunContext[ResumeDeps]) -> dict[str, str]:
     """Load user background information from markdown files."""
-    return ctx.deps.user_background
+    return ctx.deps.user_background_data
 
 
 @resume_generator.tool
 async def get_job_requirements(ctx: RunContext[ResumeDeps]) -> dict[str, Any]:
     """Get the job posting requirements and details."""
-    job = ctx.deps.job_posting
-    return {
-        "title": job.title,
-        "company": job.company,
-        "requirements": job.requirements,
-        "responsibilities": job.responsibilities,
-        "keywords": job.keywords,
-        "pay": job.pay,
-        "industry": job.industry,
-        "practical_description": job.practical_description,
-    }
+    return ctx.deps.job_requirements
 
 @resume_generator.tool
 async def get_tone_guidance(ctx: RunContext[ResumeDeps]) -> str:
     """Get tone and style guidance for the resume."""
-    if ctx.deps.tone:
-        return f"Use a {ctx.deps.tone} tone throughout the resume."
-    
-    return "Use a professional, standard tone."
+    return ctx.deps.tone_guidance
 
 @resume_generator.tool
 async def get_feedback_context(ctx: RunContext[ResumeDeps]) -> str:
     """Get any user feedback for revision."""
-    if ctx.deps.user_feedback:
-        return f"User feedback to incorporate: {ctx.deps.user_feedback}"
-    return "No specific feedback provided - create the best possible resume."
+    return ctx.deps.feedback_context
 
 @resume_generator.tool
 async def get_template_structure(ctx: RunContext[ResumeDeps]) -> dict[str, Any]:
     """Get the template structure, sections, and validation requirements."""
-    template = ctx.deps.template
-    return {
-        "template_name": template.name,
-        "template_content": template.content,
-        "required_sections": [
-            {
-                "name": section.name,
-                "display_name": section.display_name,
-                "format": section.format,
-                "description": section.description,
-                "min_length": section.min_length,
-                "max_length": section.max_length
-            }
-            for section in template.template_schema.get_required_sections()
-        ],
-        "optional_sections": [
-            {
-                "name": section.name,
-                "display_name": section.display_name,
-                "format": section.format,
-                "description": section.description,
-                "min_length": section.min_length,
-                "max_length": section.max_length
-            }
-            for section in template.template_schema.get_optional_sections()
-        ],
-        "placeholders": template.template_schema.placeholders,
-        "instructions": f"Generate resume content that exactly matches the template structure. Each required section must be present with the specified format. Template content: {template.content}"
-    }
+    return ctx.deps.template_structure
+
+# Whitespace around line breaks; collapsing it strips every line and drops blank ones
+_LINE_BREAK_WHITESPACE = re.compile(r"\s*\n\s*")
+
+
+@functools.lru_cache(maxsize=64)
+def _section_header_index(sections: tuple[tuple[str, str, str], ...]) -> dict[str, str]:
+    """Map every lowercased header variant to its section name.
+    
+    ``sections`` holds ``(name, format, display_name)`` tuples; when two sections
+    share a variant the first one wins.
+    """
+    index = {}
+    for name, fmt, display_name in sections:
+        # Try different format variations for flexibility
+        for variant in (
+            fmt,
+            f"#{fmt[1:]}",  # Convert ## to #
+            f"##{display_name}",
+            f"# {display_name}"
+        ):
+            index.setdefault(variant.lower(), name)
+    return index
+
+
+@functools.lru_cache(maxsize=64)
+def _section_header_regex(headers: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile header variants into one case-insensitive, whole-line alternation."""
+    if not headers:
+        return re.compile(r"(?!)")  # Never matches
+    alternation = "|".join(re.escape(header) for header in headers)
+    return re.compile(rf"^[^\S\n]*({alternation})[^\S\n]*$", re.IGNORECASE | re.MULTILINE)
+
+
+def _schema_headers(schema: TemplateSchema) -> tuple[re.Pattern[str], dict[str, str]]:
+    """Get the header regex and index for a schema (memoized on its sections by the builders)."""
+    header_index = _section_header_index(
+        tuple((section.name, section.format, section.display_name) for section in schema.sections)
+    )
+    return _section_header_regex(tuple(header_index)), header_index
+
 
 @resume_generator.output_validator
 async def validate_resume_completeness(ctx: RunContext[ResumeDeps], content: ResumeContent) -> ResumeContent:
     """Validate that the generated resume follows the template schema requirements."""
-    logfire.info("Starting schema-driven resume validation", resume_length=len(content.resume_markdown))
+    if _LOG_ENABLED:
+        _log_info("Starting schema-driven resume validation", resume_length=len(content.resume_markdown))
     
     template = ctx.deps.template
     schema = template.template_schema
     
-    if len(content.resume_markdown.strip()) < 100:
-        logfire.warning("Resume too short", length=len(content.resume_markdown.strip()))
+    stripped_length = len(content.resume_markdown.strip())
+    if stripped_length < 100:
+        if _LOG_ENABLED:
+            _log_warning("Resume too short", length=stripped_length)
         raise ModelRetry("Resume is too short, please provide more detailed content")
     
     # Extract sections based on schema
-    lines = content.resume_markdown.split('\n')
+    header_regex, header_index = _schema_headers(schema)
+    
+    # Slice the markdown between successive section headers
+    text = content.resume_markdown
+    headers = list(header_regex.finditer(text))
     extracted_sections = {}
-    current_section = None
-    current_content = []
     
-    for line in lines:
-        line_stripped = line.strip()
+    for i, header in enumerate(headers):
+        section_name = header_index[header.group(1).lower()]
+        if _LOG_ENABLED:
+            _log_info("Found section", section=section_name, line=header.group(0).strip())
         
-        # Check if this line starts a new section
-        section_found = None
-        for section in schema.sections:
-            # Try different format variations for flexibility
-            expected_formats = [
-                section.format,
-                f"#{section.format[1:]}",  # Convert ## to #
-                f"##{section.display_name}",
-                f"# {section.display_name}"
-            ]
-            
-            for fmt in expected_formats:
-                if line_stripped.lower() == fmt.lower():
-                    section_found = section.name
-                    logfire.info("Found section", section=section.name, line=line_stripped)
-                    break
-            if section_found:
-                break
-        
-        if section_found:
-            # Save previous section if exists
-            if current_section and current_content:
-                extracted_sections[current_section] = '\n'.join(current_content).strip()
-            
-            current_section = section_found
-            current_content = []
-        elif current_section and line_stripped:
-            current_content.append(line_stripped)
-    
-    # Save last section
-    if current_section and current_content:
-        extracted_sections[current_section] = '\n'.join(current_content).strip()
-    
-    logfire.info("Extracted sections", sections=list(extracted_sections.keys()))
+        body_end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        body = _LINE_BREAK_WHITESPACE.sub('\n', text[header.end():body_end].strip())
+        if body:
+            extracted_sections[section_name] = body
+    
+    if _LOG_ENABLED:
+        _log_info("Extracted sections", sections=list(extracted_sections.keys()))
     
     # Validate required sections
     missing_sections = []
@@ -246,50 +349,108 @@ async def validate_resume_completeness(ctx: RunContext[ResumeDeps], content: Res
         else:
             content_text = extracted_sections[section.name]
             if len(content_text) < section.min_length:
-                logfire.warning("Section too short", 
-                    section=section.name, 
-                    length=len(content_text), 
-                    min_required=section.min_length,
-                    content=content_text[:100]
-                )
+                if _LOG_ENABLED:
+                    _log_warning("Section too short", 
+                        section=section.name, 
+                        length=len(content_text), 
+                        min_required=section.min_length,
+                        content=content_text[:100]
+                    )
                 raise ModelRetry(f"Section '{section.display_name}' is too brief (minimum {section.min_length} characters). Please provide more detailed content for this section.")
     
     if missing_sections:
-        logfire.warning("Missing required sections", missing=missing_sections)
+        if _LOG_ENABLED:
+            _log_warning("Missing required sections", missing=missing_sections)
         raise ModelRetry(f"Missing required sections: {', '.join(missing_sections)}. Please include all required sections with the correct format.")
     
     # Store extracted sections in content object
     content.sections = extracted_sections
     
-    logfire.info("Resume validation passed", sections_found=len(extracted_sections))
+    if _LOG_ENABLED:
+        _log_info("Resume validation passed", sections_found=len(extracted_sections))
     return content
 
 
 
 # Simplified API functions
-async def parse_job_posting(raw_content: str, model_config: ModelConfig, job_id: str | None = None) -> JobPosting:
-    """Parse raw job posting content into structured data."""
-    # Check API key availability
-    if model_config.provider == "openai" and not os.getenv("OPENAI_API_KEY"):
-        raise ValueError("OPENAI_API_KEY environment variable is required for OpenAI models.")
-    elif model_config.provider == "anthropic" and not os.getenv("ANTHROPIC_API_KEY"):
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required for Anthropic models.")
-    
-    model_str = create_model_string(model_config)
+# Provider -> (API key environment variable, display name)
+_REQUIRED_KEY = {
+    "openai": ("OPENAI_API_KEY", "OpenAI"),
+    "anthropic": ("ANTHROPIC_API_KEY", "Anthropic"),
+}
+
+
+@functools.lru_cache
+def _validate_provider(provider: str) -> None:
+    """Check API key availability for a provider (successful checks are cached)."""
+    if provider not in _REQUIRED_KEY:
+        return
+    env_var, display_name = _REQUIRED_KEY[provider]
+    if not os.getenv(env_var):
+        raise ValueError(f"{env_var} environment variable is required for {display_name} models.")
+
+
+# Suffix for generated posting IDs so postings parsed within the same second stay unique
+_posting_counter = itertools.count()
+
+# Number of concurrent parser attempts to race per job posting (1 disables speculation)
+_SPECULATIVE_K = int(os.getenv("PINENEEDLE_SPECULATIVE_K", "1"))
+
+
+async def _run_job_parser(raw_content: str, model_config: ModelConfig, temperature: float) -> JobPostingContent:
+    """Run the job parser agent once."""
+    model = _build_model(model_config.provider, model_config.model_name)
     
     result = await job_parser_agent.run(
         f"Parse this job posting:\n\n{raw_content}",
-        model=model_str,
-        model_settings={"temperature": model_config.temperature}
+        model=model,
+        model_settings={"temperature": temperature}
     )
+    return result.output
+
+
+async def _run_job_parser_speculative(raw_content: str, model_config: ModelConfig, k: int) -> JobPostingContent:
+    """Race k parser runs and return the first one that succeeds.
+    
+    Each attempt uses a slightly lower temperature for diversity (lowering keeps it
+    within every provider's valid range). Remaining attempts are cancelled.
+    """
+    pending = {
+        asyncio.create_task(
+            _run_job_parser(raw_content, model_config, max(0.0, model_config.temperature - 0.1 * i))
+        )
+        for i in range(k)
+    }
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def parse_job_posting(raw_content: str, model_config: ModelConfig, job_id: str | None = None) -> JobPosting:
+    """Parse raw job posting content into structured data."""
+    _validate_provider(model_config.provider)
+    
+    if _SPECULATIVE_K > 1:
+        content = await _run_job_parser_speculative(raw_content, model_config, _SPECULATIVE_K)
+    else:
+        content = await _run_job_parser(raw_content, model_config, model_config.temperature)
     
     # System creates the full JobPosting with metadata
-    from datetime import datetime
-    posting_id = job_id or datetime.now().strftime("%Y%m%d%H%M%S")
-    created_at = datetime.now().isoformat()
+    now = datetime.now()
+    posting_id = job_id or f"{now.strftime('%Y%m%d%H%M%S')}{next(_posting_counter) % 10000:04d}"
+    created_at = now.isoformat()
     
     return JobPosting.from_content(
-        result.output, 
+        content, 
         posting_id, 
         created_at, 
         model_config.provider, 
@@ -298,24 +459,120 @@ async def parse_job_posting(raw_content: str, model_config: ModelConfig, job_id:
     )
 
 
-async def generate_resume(deps: ResumeDeps, model_config: ModelConfig) -> ResumeContent:
-    """Generate a tailored resume."""
-    # Check API key availability
-    if model_config.provider == "openai" and not os.getenv("OPENAI_API_KEY"):
-        raise ValueError("OPENAI_API_KEY environment variable is required for OpenAI models.")
-    elif model_config.provider == "anthropic" and not os.getenv("ANTHROPIC_API_KEY"):
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required for Anthropic models.")
+async def parse_job_postings_batch(
+    raw_contents: list[str],
+    model_config: ModelConfig,
+    max_concurrency: int = 20,
+) -> list[JobPosting | BaseException]:
+    """Parse several job postings concurrently.
+    
+    Results are returned in input order; a posting that fails to parse is
+    returned as its exception instead of aborting the whole batch.
+    Configuration errors (e.g. a missing API key) apply to every posting, so
+    they are raised once up front instead.
+    """
+    _validate_provider(model_config.provider)
+    semaphore = asyncio.Semaphore(max_concurrency)
     
-    model_str = create_model_string(model_config)
+    async def _parse_one(raw_content: str) -> JobPosting:
+        async with semaphore:
+            return await parse_job_posting(raw_content, model_config)
     
-    result = await resume_generator.run(
-        "Generate a tailored resume for this job posting using the user's background and template.",
-        deps=deps,
-        model=model_str,
-        model_settings={"temperature": model_config.temperature}
+    return await asyncio.gather(
+        *(_parse_one(raw_content) for raw_content in raw_contents),
+        return_exceptions=True
     )
+
+
+# pydantic-ai's default name for the tool that carries structured output
+_OUTPUT_TOOL_NAME: Final = "final_result"
+
+
+async def _stream_resume_markdown(stream, on_partial: Callable[[str], None]) -> None:
+    """Feed the resume markdown streamed so far to on_partial as output tool args arrive."""
+    output_args: dict[int, str] = {}
     
-    return result.output
+    async for event in stream:
+        if isinstance(event, PartStartEvent):
+            part = event.part
+            if not (isinstance(part, ToolCallPart) and part.tool_name == _OUTPUT_TOOL_NAME and isinstance(part.args, str | None)):
+                continue
+            output_args[event.index] = part.args or ""
+        elif (
+            isinstance(event, PartDeltaEvent)
+            and event.index in output_args
+            and isinstance(event.delta, ToolCallPartDelta)
+            and isinstance(event.delta.args_delta, str)
+        ):
+            output_args[event.index] += event.delta.args_delta
+        else:
+            continue
+        
+        args = output_args[event.index]
+        if not args:
+            continue
+        try:
+            partial = pydantic_core.from_json(args, allow_partial="trailing-strings")
+        except ValueError:
+            continue
+        if isinstance(partial, dict) and isinstance(partial.get("resume_markdown"), str):
+            on_partial(partial["resume_markdown"])
+
+
+async def generate_resume(
+    deps: ResumeDeps,
+    model_config: ModelConfig,
+    on_partial: Callable[[str], None] | None = None,
+) -> ResumeContent:
+    """Generate a tailored resume.
+    
+    If on_partial is given the response is streamed: it is called with the resume
+    markdown received so far, and with an empty string whenever a new model request
+    starts (so a validation retry can be shown as a fresh attempt).
+    """
+    _validate_provider(model_config.provider)
+    
+    model = _build_model(model_config.provider, model_config.model_name)
+    prompt = (
+        "Generate a tailored resume for this job posting using the user's background and template."
+        f"\n\n<CONTEXT>\n{_serialize_deps(deps)}\n</CONTEXT>"
+    )
+    model_settings = {"temperature": model_config.temperature}
+    
+    if on_partial is None:
+        result = await resume_generator.run(prompt, deps=deps, model=model, model_settings=model_settings)
+        return result.output
+    
+    async with resume_generator.iter(prompt, deps=deps, model=model, model_settings=model_settings) as agent_run:
+        async for node in agent_run:
+            if Agent.is_model_request_node(node):
+                on_partial("")
+                async with node.stream(agent_run.ctx) as stream:
+                    await _stream_resume_markdown(stream, on_partial)
+    
+    return agent_run.result.output
+
 
+ 
 
- 
\ No newline at end of file
+async def generate_resumes(
+    deps_list: list[ResumeDeps],
+    model_config: ModelConfig,
+    max_concurrency: int = 10,
+) -> list[ResumeContent]:
+    """Generate several resumes concurrently.
+    
+    Results are returned in input order. If any generation fails, the rest are
+    cancelled and the failures are raised together as an ExceptionGroup.
+    """
+    _validate_provider(model_config.provider)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _generate_one(deps: ResumeDeps) -> ResumeContent:
+        async with semaphore:
+            return await generate_resume(deps, model_config)
+    
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [task_group.create_task(_generate_one(deps)) for deps in deps_list]
+    
+    return [task.result() for task in tasks]
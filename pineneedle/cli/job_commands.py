@@ -1,11 +1,12 @@
 """CLI commands for job posting operations."""
 
-import asyncio
+import glob
+import os
 from pathlib import Path
 
 import click
 
-from ..agents import parse_job_posting
+from ..file_operations import read_bytes_fast
 from ..models import JobPosting
 
 
@@ -23,8 +24,9 @@ def add_job_posting_from_editor(fs, config, custom_id: str = None) -> tuple[str,
     content = content.strip()
     
     try:
+        from ..agents import parse_job_posting, run_sync
         click.echo("Parsing job posting...")
-        posting = asyncio.run(parse_job_posting(content, config.default_model, custom_id))
+        posting = run_sync(parse_job_posting(content, config.default_model, custom_id))
         job_id = fs.save_job_posting(posting)
         return job_id, posting
     except Exception as e:
@@ -43,15 +45,64 @@ def add_job_posting_from_file(fs, config, file_path: str, custom_id: str = None)
         return None
     
     try:
-        content = file_path_obj.read_text().strip()
+        content = file_path_obj.read_bytes().decode("utf-8").strip()
         if not content:
             click.echo("File is empty")
             return None
         
+        from ..agents import parse_job_posting, run_sync
         click.echo("Parsing job posting...")
-        posting = asyncio.run(parse_job_posting(content, config.default_model, custom_id))
+        posting = run_sync(parse_job_posting(content, config.default_model, custom_id))
         job_id = fs.save_job_posting(posting)
         return job_id, posting
     except Exception as e:
         click.echo(f"Error processing file: {e}")
-        return None 
\ No newline at end of file
+        return None 
+
+def add_job_postings_from_files(fs, config, pattern: str) -> list[tuple[str, JobPosting]]:
+    """
+    Load job postings from a directory or glob pattern, parse them concurrently and save.
+    Returns (job_id, posting) for every posting that was saved.
+    """
+    if os.path.isdir(pattern):
+        with os.scandir(pattern) as entries:
+            paths = sorted(entry.path for entry in entries if entry.is_file())
+    else:
+        paths = sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+    
+    if not paths:
+        click.echo(f"No files matched: {pattern}")
+        return []
+    
+    sources = []
+    contents = []
+    for path in paths:
+        try:
+            content = read_bytes_fast(path).decode("utf-8").strip()
+        except (OSError, UnicodeDecodeError) as e:
+            click.echo(f"Skipping {path}: {e}")
+            continue
+        if not content:
+            click.echo(f"Skipping {path}: file is empty")
+            continue
+        sources.append(path)
+        contents.append(content)
+    
+    if not contents:
+        return []
+    
+    try:
+        from ..agents import parse_job_postings_batch, run_sync
+        click.echo(f"Parsing {len(contents)} job postings...")
+        results = run_sync(parse_job_postings_batch(contents, config.default_model, max_concurrency=5))
+    except Exception as e:
+        click.echo(f"Error parsing job postings: {e}")
+        return []
+    
+    saved = []
+    for path, result in zip(sources, results):
+        if isinstance(result, BaseException):
+            click.echo(f"Error parsing {path}: {result}")
+            continue
+        saved.append((fs.save_job_posting(result), result))
+    return saved
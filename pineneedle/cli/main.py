@@ -1,23 +1,22 @@
 """Main CLI commands for Pineneedle."""
 
-import asyncio
+import functools
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
 
-from ..agents import parse_job_posting, generate_resume
-from ..models import ModelConfig, ResumeDeps
+from ..environment import load_environment
+from ..file_operations import read_bytes_fast
 from ..services import FileSystemService, PDFMetadataService
-from ..pdf import PDFGenerator
 from ..filename_utils import generate_pdf_filename_from_resume
-from .job_commands import add_job_posting_from_editor, add_job_posting_from_file
+from .job_commands import add_job_posting_from_editor, add_job_posting_from_file, add_job_postings_from_files
 
 # Load environment variables
-load_dotenv()
+load_environment()
 
 
 @click.group(invoke_without_command=True)
@@ -31,12 +30,14 @@ def cli(ctx: click.Context, workspace: str, profile: str | None) -> None:
     ctx.obj['workspace'] = workspace_path
     
     # Load config to get current profile
-    temp_fs = FileSystemService(workspace_path)
-    config = temp_fs.load_config()
+    fs = FileSystemService(workspace_path)
+    config = fs.load_config()
     
-    # Use provided profile or config default
+    # Use provided profile or config default, reusing the same service
     current_profile = profile or config.current_profile
-    ctx.obj['fs'] = FileSystemService(workspace_path, current_profile)
+    if current_profile != fs.current_profile:
+        fs.switch_profile(current_profile)
+    ctx.obj['fs'] = fs
     ctx.obj['config'] = config
     
     # Update current profile in config if different
@@ -80,14 +81,23 @@ def job() -> None:
 @job.command("add")
 @click.argument('content', required=False)
 @click.option('--file', '-f', help='Read job posting from file')
+@click.option('--files', help='Read and parse every job posting in a directory or glob pattern')
 @click.option('--id', help='Custom ID for the job posting')
 @click.option('--stdin', is_flag=True, help='Read job posting from stdin')
 @click.pass_context
-def job_add(ctx: click.Context, content: str | None, file: str | None, id: str | None, stdin: bool) -> None:
+def job_add(ctx: click.Context, content: str | None, file: str | None, files: str | None, id: str | None, stdin: bool) -> None:
     """Add a new job posting."""
     fs: FileSystemService = ctx.obj['fs']
     config = ctx.obj['config']
     
+    if files:
+        if content or file or stdin or id:
+            raise click.UsageError("--files cannot be combined with CONTENT/--file/--stdin/--id")
+        # Batch mode - parse all matching files concurrently
+        for job_id, posting in add_job_postings_from_files(fs, config, files):
+            click.echo(f"✓ {job_id}: {posting.title} at {posting.company}")
+        return
+    
     if not content and not file and not stdin:
         # Interactive mode - use CLI function
         result = add_job_posting_from_editor(fs, config, id)
@@ -97,12 +107,13 @@ def job_add(ctx: click.Context, content: str | None, file: str | None, id: str |
         job_id, posting = result
     elif stdin:
         # Explicit stdin mode - for piped input
-        content = sys.stdin.read().strip()
+        content = sys.stdin.buffer.read().decode("utf-8", errors="replace").strip()
         if not content:
             click.echo("No content provided via stdin")
             return
         try:
-            posting = asyncio.run(parse_job_posting(content, config.default_model, id))
+            from ..agents import parse_job_posting, run_sync
+            posting = run_sync(parse_job_posting(content, config.default_model, id))
             job_id = fs.save_job_posting(posting)
         except Exception as e:
             click.echo(f"Error parsing job posting: {e}")
@@ -119,7 +130,8 @@ def job_add(ctx: click.Context, content: str | None, file: str | None, id: str |
             click.echo("No content provided")
             return
         try:
-            posting = asyncio.run(parse_job_posting(content, config.default_model, id))
+            from ..agents import parse_job_posting, run_sync
+            posting = run_sync(parse_job_posting(content, config.default_model, id))
             job_id = fs.save_job_posting(posting)
         except Exception as e:
             click.echo(f"Error parsing job posting: {e}")
@@ -131,6 +143,21 @@ def job_add(ctx: click.Context, content: str | None, file: str | None, id: str |
     click.echo(f"Location: {posting.location or 'Not specified'}")
 
 
+_ISO_MINUTE_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
+
+@functools.lru_cache(maxsize=256)
+def _format_created_at(created_at: str) -> str:
+    """Format an ISO created_at timestamp for display."""
+    # ISO timestamps already start with "YYYY-MM-DDTHH:MM", so slice instead of parsing
+    if isinstance(created_at, str) and _ISO_MINUTE_PREFIX.match(created_at):
+        return f"{created_at[:10]} {created_at[11:16]}"
+    try:
+        return datetime.fromisoformat(created_at).strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        return "Unknown"
+
+
 @job.command("list")
 @click.pass_context
 def job_list(ctx: click.Context) -> None:
@@ -146,12 +173,7 @@ def job_list(ctx: click.Context) -> None:
     click.echo(f"Found {len(postings)} job posting(s):\n")
     
     for posting in postings:
-        # Format the created_at datetime for display
-        try:
-            created_dt = datetime.fromisoformat(posting.created_at.replace('Z', '+00:00'))
-            created_str = created_dt.strftime("%Y-%m-%d %H:%M")
-        except (ValueError, AttributeError):
-            created_str = "Unknown"
+        created_str = _format_created_at(posting.created_at)
         
         click.echo(f"ID: {posting.id}")
         click.echo(f"Title: {posting.title}")
@@ -161,6 +183,22 @@ def job_list(ctx: click.Context) -> None:
         click.echo("-" * 40)
 
 
+class _StreamEcho:
+    """Echo streamed resume markdown incrementally, restarting on a retried attempt."""
+    
+    def __init__(self) -> None:
+        self.shown = ""
+    
+    def __call__(self, text: str) -> None:
+        if not text.startswith(self.shown):
+            click.echo("\n\n[Regenerating...]\n")
+            self.shown = ""
+        if len(text) > len(self.shown):
+            click.echo(text[len(self.shown):], nl=False)
+            sys.stdout.flush()
+            self.shown = text
+
+
 @cli.command()
 @click.argument('job_id')
 @click.option('--tone', help='Tone for the resume (e.g., casual, technical, formal)')
@@ -169,6 +207,9 @@ def job_list(ctx: click.Context) -> None:
 @click.pass_context
 def generate(ctx: click.Context, job_id: str, tone: str | None, model: str | None, temperature: float | None) -> None:
     """Generate a resume for a job posting."""
+    from ..agents import generate_resume, run_sync
+    from ..models import ModelConfig, ResumeDeps
+    
     fs: FileSystemService = ctx.obj['fs']
     config = ctx.obj['config']
     
@@ -211,15 +252,20 @@ def generate(ctx: click.Context, job_id: str, tone: str | None, model: str | Non
     click.echo(f"Using model: {model_config.provider}:{model_config.model_name}")
     
     try:
-        resume_content = asyncio.run(generate_resume(deps, model_config))
+        click.echo("\nResume content:")
+        click.echo("=" * 50)
+        echo = _StreamEcho()
+        resume_content = run_sync(generate_resume(deps, model_config, on_partial=echo))
+        # Models that don't stream the output tool's args as text show nothing (or a stale
+        # attempt) while running, so make sure the final resume is what ends up on screen
+        if echo.shown != resume_content.resume_markdown:
+            echo(resume_content.resume_markdown)
+        click.echo()
         
         # Save the resume
-        resume_path = fs.save_resume(job_posting.id, resume_content)
+        resume_path = fs.save_resume(job_posting.id, resume_content, job_posting)
         
-        click.echo(f"✓ Resume generated and saved to: {resume_path}")
-        click.echo("\nResume content:")
-        click.echo("=" * 50)
-        click.echo(resume_content.resume_markdown)
+        click.echo(f"\n✓ Resume generated and saved to: {resume_path}")
         
     except Exception as e:
         click.echo(f"Error generating resume: {e}")
@@ -242,7 +288,7 @@ def export(ctx: click.Context, job_id: str, template: str, output: str | None, v
     # Load the resume content
     resume_path = fs.get_resume_version(job_id, version)
     
-    if not resume_path or not resume_path.exists():
+    if not resume_path:
         if version:
             click.echo(f"No resume version '{version}' found for job ID: {job_id}")
         else:
@@ -254,18 +300,17 @@ def export(ctx: click.Context, job_id: str, template: str, output: str | None, v
             click.echo(f"Available versions: {', '.join([v[0] for v in versions])}")
         return
     
-    # Create PDF generator
-    pdf_gen = PDFGenerator()
+    # Only load the PDF stack for export (weasyprint itself loads on first render)
+    from ..pdf import PDFGenerator, get_pdf_generator
     
-    # Check if template is valid
-    available_templates = pdf_gen.get_available_templates()
+    # Check if template is valid before building the generator
+    available_templates = PDFGenerator.get_available_templates()
     if template not in available_templates:
         click.echo(f"Invalid template '{template}'. Available: {', '.join(available_templates)}")
         return
     
-    # Get resume directory and setup metadata tracking
-    resume_dir = fs.fs.get_profile_path("resumes", job_id)
-    fs.fs.ensure_directory(resume_dir)  # Make sure directory exists
+    # Setup metadata tracking (the resume directory exists since resume_path was found in it)
+    resume_dir = resume_path.parent
     pdf_metadata = PDFMetadataService(resume_dir)
     
     # Set output path based on the resume markdown filename
@@ -276,7 +321,7 @@ def export(ctx: click.Context, job_id: str, template: str, output: str | None, v
         
         # Check if PDF already exists
         existing_pdf = pdf_metadata.get_pdf_path(resume_filename, template)
-        if existing_pdf and existing_pdf.exists():
+        if existing_pdf:
             click.echo(f"PDF already exists: {existing_pdf}")
             if not click.confirm("Do you want to regenerate it?", default=False):
                 click.echo(f"✓ Using existing PDF: {existing_pdf}")
@@ -284,20 +329,24 @@ def export(ctx: click.Context, job_id: str, template: str, output: str | None, v
     else:
         output_path = Path(output)
     
+    pdf_gen = get_pdf_generator()
+    
     try:
         # Read resume content
-        resume_content = resume_path.read_text()
+        resume_content = read_bytes_fast(resume_path).decode("utf-8")
         
         # Generate PDF
         click.echo(f"Generating PDF with '{template}' template...")
         pdf_path = pdf_gen.generate(resume_content, output_path, template)
         
-        # Record PDF generation in metadata (if using default naming)
+        # Record PDF generation in metadata (if using default naming); the record carries the size
         if output is None:
-            pdf_metadata.record_pdf_generation(resume_filename, template, pdf_path)
+            file_size = pdf_metadata.record_pdf_generation(resume_filename, template, pdf_path).file_size
+        else:
+            file_size = pdf_path.stat().st_size
         
         click.echo(f"✓ PDF exported to: {pdf_path}")
-        click.echo(f"File size: {pdf_path.stat().st_size:,} bytes")
+        click.echo(f"File size: {file_size:,} bytes")
         
     except Exception as e:
         click.echo(f"Error generating PDF: {e}")
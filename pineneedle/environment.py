@@ -0,0 +1,30 @@
+"""Environment loading for Pineneedle."""
+
+import functools
+import os
+
+
+def _find_env_file() -> str | None:
+    """Find the nearest .env walking up from the package directory.
+    
+    This is where load_dotenv()'s own search starts when called from this module,
+    but without its call-stack inspection (one stat per frame).
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(directory, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+@functools.lru_cache(maxsize=1)
+def load_environment() -> None:
+    """Load variables from .env into the process environment, once per process."""
+    env_file = _find_env_file()
+    if env_file is not None:
+        from dotenv import load_dotenv
+        load_dotenv(env_file)
@@ -1,10 +1,71 @@
 """Basic file operations helper."""
 
+import functools
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (the `fast` extra); fall back to stdlib json
+    orjson = None
+
+
+# Raw fds default to text mode on Windows; O_BINARY only exists there
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def read_bytes_fast(path: Path | str) -> bytes:
+    """Read a whole file through a raw fd, skipping buffered file objects."""
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        # st_size is only a hint (pipes report 0, files can grow), so read until EOF
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size + 1 if size else 65536)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+        return chunks[0] if len(chunks) == 2 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=8)
+def resolve_data_path(data_dir_env: str | None, workspace_path: Path) -> Path:
+    """Resolve the data directory (PINENEEDLE_DATA_DIR if set, else workspace/data)."""
+    if data_dir_env:
+        return Path(data_dir_env).expanduser().resolve()
+    return workspace_path / "data"
+
+
+def write_bytes_atomic(path: Path | str, data: bytes) -> None:
+    """Write a whole file via a temp file and os.replace, so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            # Flush to disk before the rename, or a power loss can leave the new name empty
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def model_json_bytes(model: BaseModel, indent: int | None = 2) -> bytes:
+    """Serialize a pydantic model straight to JSON bytes (model_dump_json minus the str round trip)."""
+    return model.__pydantic_serializer__.to_json(model, indent=indent)
+
 
 class FileOperations:
     """Handles basic file system operations."""
@@ -14,14 +75,12 @@ class FileOperations:
         self.current_profile = profile_name
         
         # Use PINENEEDLE_DATA_DIR environment variable if set, otherwise default to workspace/data
-        data_dir_env = os.getenv("PINENEEDLE_DATA_DIR")
-        if data_dir_env:
-            self.data_path = Path(data_dir_env).expanduser().resolve()
-        else:
-            self.data_path = workspace_path / "data"
+        self.data_path = resolve_data_path(os.getenv("PINENEEDLE_DATA_DIR"), workspace_path)
+        self._data_prefix = f"{self.data_path}{os.sep}"
             
         # Profile-specific data path
         self.profile_path = self.data_path / "profiles" / self.current_profile
+        self._profile_prefix = f"{self.profile_path}{os.sep}"
     
     def ensure_directory(self, path: Path) -> None:
         """Create directory if it doesn't exist."""
@@ -30,36 +89,55 @@ class FileOperations:
     def read_text_safe(self, path: Path, encoding: str = "utf-8") -> str:
         """Read text file content or return empty string if file doesn't exist."""
         try:
-            return path.read_text(encoding=encoding)
+            return read_bytes_fast(path).decode(encoding)
         except FileNotFoundError:
             return ""
     
+    def read_bytes_safe(self, path: Path) -> bytes:
+        """Read raw file bytes or return empty bytes if file doesn't exist."""
+        try:
+            return read_bytes_fast(path)
+        except FileNotFoundError:
+            return b""
+    
     def write_text(self, path: Path, content: str, encoding: str = "utf-8") -> None:
         """Write text content to file, creating directories if needed."""
+        self.write_bytes(path, content.encode(encoding))
+    
+    def write_bytes(self, path: Path, content: bytes) -> None:
+        """Write bytes to file, creating directories if needed."""
         self.ensure_directory(path.parent)
-        path.write_text(content, encoding=encoding)
+        write_bytes_atomic(path, content)
     
     def read_json(self, path: Path) -> dict[str, Any]:
         """Read JSON file content."""
-        content = self.read_text_safe(path)
+        content = self.read_bytes_safe(path)
         if not content:
             return {}
+        if orjson is not None:
+            return orjson.loads(content)
         return json.loads(content)
     
     def write_json(self, path: Path, data: dict[str, Any], indent: int = 2) -> None:
         """Write data to JSON file."""
-        content = json.dumps(data, indent=indent)
-        self.write_text(path, content)
+        if orjson is not None and indent == 2:
+            # orjson emits UTF-8 bytes directly but only supports 2-space indentation
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(data, indent=indent).encode("utf-8")
+        self.write_bytes(path, content)
     
     def get_profile_path(self, *parts: str) -> Path:
         """Get path relative to current profile directory."""
-        return self.profile_path.joinpath(*parts)
+        # One string join + Path() is cheaper than joinpath's per-part parsing
+        return Path(self._profile_prefix + os.sep.join(parts)) if parts else self.profile_path
     
     def get_data_path(self, *parts: str) -> Path:
         """Get path relative to data directory."""
-        return self.data_path.joinpath(*parts)
+        return Path(self._data_prefix + os.sep.join(parts)) if parts else self.data_path
     
     def switch_profile(self, profile_name: str) -> None:
         """Switch to a different profile."""
         self.current_profile = profile_name
-        self.profile_path = self.data_path / "profiles" / profile_name 
\ No newline at end of file
+        self.profile_path = self.data_path / "profiles" / profile_name
+        self._profile_prefix = f"{self.profile_path}{os.sep}" 
\ No newline at end of file
@@ -1,19 +1,36 @@
 """Filename utilities for safe file naming."""
 
+import functools
 import re
 from datetime import datetime
 from pathlib import Path
 
 from .models import JobPosting
 
+_STRIP_RE = re.compile(r'[^\w\s-]')
+_COLLAPSE_RE = re.compile(r'[\s_-]+')
+_UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
 
+# ASCII fast path: one translate pass that drops what _STRIP_RE drops and turns
+# what _COLLAPSE_RE collapses into "_", derived from the regexes so the two agree
+_ASCII_TABLE = str.maketrans({
+    chr(code): None if _STRIP_RE.match(chr(code)) else '_'
+    for code in range(128)
+    if _STRIP_RE.match(chr(code)) or _COLLAPSE_RE.match(chr(code))
+})
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_for_filename(text: str) -> str:
     """Convert text to filename-safe string."""
     if not text:
         return "unknown"
     # Replace spaces and special chars with underscores, lowercase
-    sanitized = re.sub(r'[^\w\s-]', '', text.lower())
-    sanitized = re.sub(r'[\s_-]+', '_', sanitized)
+    if text.isascii():
+        sanitized = _UNDERSCORE_RUN_RE.sub('_', text.lower().translate(_ASCII_TABLE))
+    else:
+        sanitized = _STRIP_RE.sub('', text.lower())
+        sanitized = _COLLAPSE_RE.sub('_', sanitized)
     return sanitized.strip('_')
 
 
@@ -1,10 +1,15 @@
 """Core Pydantic models for Pineneedle."""
 
+import os
 from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from .file_operations import read_bytes_fast, resolve_data_path
 
 
 class UserBackground(BaseModel):
@@ -17,6 +22,9 @@ class UserBackground(BaseModel):
 
 class JobPostingContent(BaseModel):
     """Content extracted from job posting by LLM - no system metadata."""
+    # Never mutated once parsed; JobPosting inherits this along with the fields
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     company: str
     location: str | None
@@ -28,18 +36,9 @@ class JobPostingContent(BaseModel):
     practical_description: str  # What the job would actually entail in practice, not HR speak
 
 
-class JobPosting(BaseModel):
+class JobPosting(JobPostingContent):
     """Complete job posting with system metadata."""
     id: str  # System-generated numeric timestamp
-    title: str
-    company: str
-    location: str | None
-    requirements: list[str]
-    responsibilities: list[str]
-    keywords: list[str]
-    pay: str | None
-    industry: str  # Approximation of what industry this role is in
-    practical_description: str  # What the job would actually entail in practice, not HR speak
     created_at: str  # ISO format datetime when posting was added
     raw_content: str
     model_provider: str = "unknown"  # Provider used to parse this posting (e.g., "openai", "anthropic")
@@ -48,17 +47,10 @@ class JobPosting(BaseModel):
     @classmethod
     def from_content(cls, content: JobPostingContent, id: str, created_at: str, model_provider: str, model_name: str, raw_content: str) -> 'JobPosting':
         """Create JobPosting from LLM content and system metadata."""
-        return cls(
+        # content was validated when the LLM output was parsed, so skip validating it again
+        return cls.model_construct(
+            **content.__dict__,
             id=id,
-            title=content.title,
-            company=content.company,
-            location=content.location,
-            requirements=content.requirements,
-            responsibilities=content.responsibilities,
-            keywords=content.keywords,
-            pay=content.pay,
-            industry=content.industry,
-            practical_description=content.practical_description,
             created_at=created_at,
             raw_content=raw_content,
             model_provider=model_provider,
@@ -75,6 +67,8 @@ class ModelConfig(BaseModel):
 
 class ProfileConfig(BaseModel):
     """Configuration for a specific profile."""
+    model_config = ConfigDict(frozen=True)
+    
     # Profile metadata
     display_name: str
     description: str = ""
@@ -88,14 +82,12 @@ class ProfileConfig(BaseModel):
     default_template: str = "default"
     
     @classmethod
-    def create_default(cls, display_name: str, description: str = "") -> 'ProfileConfig':
-        """Create a default profile configuration."""
-        from datetime import datetime
-        
+    def create_default(cls, display_name: str, description: str = "", created_at: str | None = None) -> 'ProfileConfig':
+        """Create a default profile configuration (created_at defaults to now)."""
         return cls(
             display_name=display_name,
             description=description,
-            created_at=datetime.now().isoformat(),
+            created_at=created_at or datetime.now().isoformat(),
         )
 
 
@@ -117,17 +109,36 @@ class TemplateSchema(BaseModel):
     sections: list[TemplateSection]
     placeholders: dict[str, str] = {}  # Additional placeholder variables
     
+    # Section lookups are split once per schema; sections are never modified after loading
+    @cached_property
+    def sections_by_name(self) -> dict[str, TemplateSection]:
+        """Sections keyed by name (first one wins on duplicates)."""
+        by_name: dict[str, TemplateSection] = {}
+        for s in self.sections:
+            by_name.setdefault(s.name, s)
+        return by_name
+    
+    @cached_property
+    def required_sections(self) -> list[TemplateSection]:
+        """Required sections, in template order."""
+        return [s for s in self.sections if s.required]
+    
+    @cached_property
+    def optional_sections(self) -> list[TemplateSection]:
+        """Optional sections, in template order."""
+        return [s for s in self.sections if not s.required]
+    
     def get_section(self, name: str) -> TemplateSection | None:
         """Get a section by name."""
-        return next((s for s in self.sections if s.name == name), None)
+        return self.sections_by_name.get(name)
     
     def get_required_sections(self) -> list[TemplateSection]:
         """Get all required sections."""
-        return [s for s in self.sections if s.required]
+        return self.required_sections
     
     def get_optional_sections(self) -> list[TemplateSection]:
         """Get all optional sections."""
-        return [s for s in self.sections if not s.required]
+        return self.optional_sections
 
 
 class Template(BaseModel):
@@ -160,12 +171,36 @@ class PDFMetadata(BaseModel):
 
 class ProfileInfo(BaseModel):
     """Information about a user profile."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     display_name: str
     created_at: str
     description: str = ""
 
 
+def _env_default_model() -> ModelConfig:
+    """Default model settings, potentially overridden by environment variables."""
+    env = os.environ
+    return ModelConfig(
+        provider=env.get("PINENEEDLE_DEFAULT_PROVIDER", "openai"),
+        model_name=env.get("PINENEEDLE_DEFAULT_MODEL", "gpt-4o"),
+        temperature=float(env.get("PINENEEDLE_DEFAULT_TEMPERATURE", "0.7"))
+    )
+
+
+def _default_profiles() -> dict[str, ProfileInfo]:
+    """Profiles for a config that doesn't list any."""
+    return {
+        "default": ProfileInfo(
+            name="default",
+            display_name="Default Profile",
+            created_at=datetime.now().isoformat(),
+            description="Your main profile"
+        )
+    }
+
+
 class PineneedleConfig(BaseModel):
     """Application configuration."""
     default_model: ModelConfig = ModelConfig()
@@ -180,49 +215,25 @@ class PineneedleConfig(BaseModel):
     @classmethod
     def load(cls, config_path: Path | None = None) -> 'PineneedleConfig':
         """Load configuration from file with defaults."""
-        import os
-        from datetime import datetime
-        
-        # Start with defaults, potentially overridden by environment variables
-        default_model = ModelConfig(
-            provider=os.getenv("PINENEEDLE_DEFAULT_PROVIDER", "openai"),
-            model_name=os.getenv("PINENEEDLE_DEFAULT_MODEL", "gpt-4o"),
-            temperature=float(os.getenv("PINENEEDLE_DEFAULT_TEMPERATURE", "0.7"))
-        )
-        
         # If no config_path provided, try to find it in the data directory
         if config_path is None:
-            data_dir_env = os.getenv("PINENEEDLE_DATA_DIR")
-            if data_dir_env:
-                data_path = Path(data_dir_env).expanduser().resolve()
-                config_path = data_path / "config.json"
-            else:
-                config_path = Path.cwd() / "data" / "config.json"
-        
-        # Default profiles
-        default_profiles = {
-            "default": ProfileInfo(
-                name="default",
-                display_name="Default Profile",
-                created_at=datetime.now().isoformat(),
-                description="Your main profile"
-            )
-        }
+            config_path = resolve_data_path(os.environ.get("PINENEEDLE_DATA_DIR"), Path.cwd()) / "config.json"
         
+        # Defaults are only built for what the file doesn't provide
         if config_path and config_path.exists():
-            import json
-            data = json.loads(config_path.read_text())
+            # Parse and validate the raw bytes in one pass, no intermediate dict
+            config = cls.model_validate_json(read_bytes_fast(config_path))
             # Override with file settings if they exist
-            if 'default_model' not in data:
-                data['default_model'] = default_model.model_dump()
-            if 'profiles' not in data:
-                data['profiles'] = {name: info.model_dump() for name, info in default_profiles.items()}
-            return cls.model_validate(data)
+            if 'default_model' not in config.model_fields_set:
+                config.default_model = _env_default_model()
+            if 'profiles' not in config.model_fields_set:
+                config.profiles = _default_profiles()
+            return config
         
         return cls(
-            default_model=default_model, 
+            default_model=_env_default_model(), 
             workspace_path=Path.cwd(),
-            profiles=default_profiles
+            profiles=_default_profiles()
         )
 
 
@@ -236,4 +247,72 @@ class ResumeDeps:
     user_background: UserBackground
     template: Template  # Changed from str to Template object with schema
     tone: str | None
-    user_feedback: str | None 
\ No newline at end of file
+    user_feedback: str | None
+    
+    @cached_property
+    def user_background_data(self) -> dict[str, str]:
+        """User background as plain data, dumped once per generation run."""
+        return self.user_background.model_dump(mode="json")
+    
+    @cached_property
+    def job_requirements(self) -> dict[str, Any]:
+        """Job posting requirements and details."""
+        job = self.job_posting
+        return {
+            "title": job.title,
+            "company": job.company,
+            "requirements": job.requirements,
+            "responsibilities": job.responsibilities,
+            "keywords": job.keywords,
+            "pay": job.pay,
+            "industry": job.industry,
+            "practical_description": job.practical_description,
+        }
+    
+    @cached_property
+    def tone_guidance(self) -> str:
+        """Tone and style guidance for the resume."""
+        if self.tone:
+            return f"Use a {self.tone} tone throughout the resume."
+        
+        return "Use a professional, standard tone."
+    
+    @cached_property
+    def feedback_context(self) -> str:
+        """User feedback context for revision."""
+        if self.user_feedback:
+            return f"User feedback to incorporate: {self.user_feedback}"
+        return "No specific feedback provided - create the best possible resume."
+    
+    @cached_property
+    def template_structure(self) -> dict[str, Any]:
+        """Template structure, sections, and validation requirements, built once per run."""
+        template = self.template
+        return {
+            "template_name": template.name,
+            "template_content": template.content,
+            "required_sections": [
+                {
+                    "name": section.name,
+                    "display_name": section.display_name,
+                    "format": section.format,
+                    "description": section.description,
+                    "min_length": section.min_length,
+                    "max_length": section.max_length
+                }
+                for section in template.template_schema.get_required_sections()
+            ],
+            "optional_sections": [
+                {
+                    "name": section.name,
+                    "display_name": section.display_name,
+                    "format": section.format,
+                    "description": section.description,
+                    "min_length": section.min_length,
+                    "max_length": section.max_length
+                }
+                for section in template.template_schema.get_optional_sections()
+            ],
+            "placeholders": template.template_schema.placeholders,
+            "instructions": f"Generate resume content that exactly matches the template structure. Each required section must be present with the specified format. Template content: {template.content}"
+        } 
\ No newline at end of file
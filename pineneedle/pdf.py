@@ -1,19 +1,32 @@
 """PDF generation and styling for resumes."""
 
+import functools
 import os
+import sys
 from pathlib import Path
-from typing import Dict
-import markdown
+from typing import TYPE_CHECKING, Dict
 
-# Fix library path for weasyprint on macOS
-if os.name == 'posix' and os.uname().sysname == 'Darwin':  # macOS
-    homebrew_lib = '/opt/homebrew/lib'
-    if homebrew_lib not in os.environ.get('DYLD_FALLBACK_LIBRARY_PATH', ''):
-        current_path = os.environ.get('DYLD_FALLBACK_LIBRARY_PATH', '')
-        new_path = f"{homebrew_lib}:{current_path}" if current_path else homebrew_lib
-        os.environ['DYLD_FALLBACK_LIBRARY_PATH'] = new_path
+if TYPE_CHECKING:
+    import weasyprint
 
-from weasyprint import HTML, CSS
+
+@functools.lru_cache(maxsize=1)
+def _load_weasyprint():
+    """Import weasyprint on first use; it is slow to import and only rendering needs it."""
+    # Fix library path for weasyprint on macOS (must happen before its native libs load)
+    if sys.platform == 'darwin':
+        homebrew_lib = '/opt/homebrew/lib'
+        if homebrew_lib not in os.environ.get('DYLD_FALLBACK_LIBRARY_PATH', ''):
+            current_path = os.environ.get('DYLD_FALLBACK_LIBRARY_PATH', '')
+            new_path = f"{homebrew_lib}:{current_path}" if current_path else homebrew_lib
+            os.environ['DYLD_FALLBACK_LIBRARY_PATH'] = new_path
+    
+    import weasyprint
+    return weasyprint
+
+
+# Parsed stylesheets shared by all generators, keyed by template class and filled on first use
+_STYLESHEETS: Dict[type, "weasyprint.CSS"] = {}
 
 
 class PDFStyleTemplate:
@@ -198,11 +211,17 @@ class ModernTemplate(PDFStyleTemplate):
 class PDFGenerator:
     """Converts markdown resume to PDF with template support."""
     
+    TEMPLATE_CLASSES: Dict[str, type[PDFStyleTemplate]] = {
+        'professional': ProfessionalTemplate,
+        'modern': ModernTemplate,
+    }
+    
     def __init__(self):
+        import markdown  # ~25 ms to import; template listing doesn't need it
+        
         self.md = markdown.Markdown(extensions=['tables', 'nl2br'])
         self.templates: Dict[str, PDFStyleTemplate] = {
-            'professional': ProfessionalTemplate(),
-            'modern': ModernTemplate(),
+            name: template_class() for name, template_class in self.TEMPLATE_CLASSES.items()
         }
     
     def generate(self, content: str, output_path: Path, template: str = 'professional') -> Path:
@@ -211,25 +230,30 @@ class PDFGenerator:
             available = ', '.join(self.templates.keys())
             raise ValueError(f"Unknown template '{template}'. Available: {available}")
         
-        # Convert markdown to HTML
-        html_content = self.md.convert(content)
+        # Convert markdown to HTML (reset clears state left by the previous document)
+        html_content = self.md.reset().convert(content)
         
         # Create full HTML document with basic styling
         full_html = self._create_html_document(html_content)
         
-        # Get CSS for the template
-        template_obj = self.templates[template]
-        css_content = template_obj.get_css()
+        weasyprint = _load_weasyprint()
+        
+        # Get CSS for the template, parsing it only once per process
+        template_class = type(self.templates[template])
+        stylesheet = _STYLESHEETS.get(template_class)
+        if stylesheet is None:
+            stylesheet = _STYLESHEETS[template_class] = weasyprint.CSS(string=self.templates[template].get_css())
         
         # Generate PDF
         pdf_path = output_path.with_suffix('.pdf')
-        HTML(string=full_html).write_pdf(pdf_path, stylesheets=[CSS(string=css_content)])
+        weasyprint.HTML(string=full_html).write_pdf(pdf_path, stylesheets=[stylesheet])
         
         return pdf_path
     
-    def get_available_templates(self) -> list[str]:
-        """Get list of available template names."""
-        return list(self.templates.keys())
+    @classmethod
+    def get_available_templates(cls) -> list[str]:
+        """Get list of available template names (no generator instance needed)."""
+        return list(cls.TEMPLATE_CLASSES)
     
     def _create_html_document(self, body_content: str) -> str:
         """Wrap markdown-converted content in a full HTML document."""
@@ -245,4 +269,10 @@ class PDFGenerator:
             {body_content}
         </body>
         </html>
-        """ 
\ No newline at end of file
+        """ 
+
+
+@functools.lru_cache(maxsize=1)
+def get_pdf_generator() -> PDFGenerator:
+    """Get the PDFGenerator shared by all exports in this process."""
+    return PDFGenerator()
@@ -1,7 +1,8 @@
 """App-wide profile management service."""
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 
 from .models import ProfileInfo
 
@@ -12,6 +13,27 @@ class ProfileService:
     def __init__(self, fs, config):
         self.fs = fs
         self.config = config
+        self._batch_depth = 0
+        self._config_dirty = False
+    
+    @contextmanager
+    def batch(self) -> Iterator["ProfileService"]:
+        """Defer config saves until the outermost batch exits, then save once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._config_dirty:
+                self._config_dirty = False
+                self.fs.save_config(self.config)
+    
+    def _save_config(self) -> None:
+        """Save the config now, or mark it for saving when inside a batch."""
+        if self._batch_depth:
+            self._config_dirty = True
+        else:
+            self.fs.save_config(self.config)
     
     def list_profiles(self) -> List[ProfileInfo]:
         """List all available profiles."""
@@ -27,7 +49,7 @@ class ProfileService:
             return False
         
         self.config.current_profile = profile_name
-        self.fs.save_config(self.config)
+        self._save_config()
         self.fs.switch_profile(profile_name)
         return True
     
@@ -39,7 +61,7 @@ class ProfileService:
         try:
             profile_info = self.fs.create_profile(name, display_name, description)
             self.config.profiles[name] = profile_info
-            self.fs.save_config(self.config)
+            self._save_config()
             return True
         except Exception:
             return False
@@ -49,16 +71,18 @@ class ProfileService:
         if profile_name == "default" or profile_name not in self.config.profiles:
             return False
         
-        # If deleting the current profile, switch to default first
-        if profile_name == self.config.current_profile:
-            if not self.switch_profile("default"):
-                return False  # Failed to switch to default
-        
-        if self.fs.delete_profile(profile_name):
-            del self.config.profiles[profile_name]
-            self.fs.save_config(self.config)
-            return True
-        return False
+        # Switching and deleting both change the config; write it once
+        with self.batch():
+            # If deleting the current profile, switch to default first
+            if profile_name == self.config.current_profile:
+                if not self.switch_profile("default"):
+                    return False  # Failed to switch to default
+            
+            if self.fs.delete_profile(profile_name):
+                del self.config.profiles[profile_name]
+                self._save_config()
+                return True
+            return False
     
     def get_profile_status(self) -> dict:
         """Get status information about the current profile."""
@@ -1,12 +1,22 @@
 """Service layer for file operations and utilities."""
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
-from .file_operations import FileOperations
-from .filename_utils import generate_job_posting_filename, generate_resume_filename, parse_timestamp_from_resume_filename
+from pydantic import ValidationError
+
+from .file_operations import FileOperations, model_json_bytes, read_bytes_fast, write_bytes_atomic
+from .filename_utils import (
+    generate_job_posting_filename,
+    generate_pdf_filename_from_resume,
+    generate_resume_filename,
+    parse_timestamp_from_resume_filename,
+)
 from .models import (
     JobPosting,
     PDFGenerationRecord,
@@ -15,9 +25,126 @@ from .models import (
     ProfileConfig,
     ProfileInfo,
     ResumeContent,
+    Template,
+    TemplateSchema,
     UserBackground,
 )
-from .pdf import PDFGenerator
+
+
+_EXAMPLE_BACKGROUND_FILES = ("contact.md", "education.md", "experience.md", "reference.md")
+_PROFILE_SUBDIRS = ("background", "templates", "job_postings", "resumes")
+
+# Default resume template and schema written when a profile has none
+_DEFAULT_TEMPLATE: Final[str] = """# {name}
+{contact_info}
+
+## Summary
+{summary}
+
+## Experience
+{experience}
+
+## Education
+{education}
+
+## Skills
+{skills}
+"""
+
+# Treated as read-only: it is only dumped to YAML and validated
+_DEFAULT_TEMPLATE_SCHEMA: Final[dict[str, Any]] = {
+    "name": "default",
+    "description": "Standard resume template with essential sections",
+    "sections": [
+        {
+            "name": "summary",
+            "display_name": "Summary",
+            "required": True,
+            "format": "## Summary",
+            "min_length": 20,
+            "description": "Professional summary highlighting key qualifications and experience"
+        },
+        {
+            "name": "experience",
+            "display_name": "Experience", 
+            "required": True,
+            "format": "## Experience",
+            "min_length": 50,
+            "description": "Work experience and professional achievements"
+        },
+        {
+            "name": "education",
+            "display_name": "Education",
+            "required": True,
+            "format": "## Education", 
+            "min_length": 20,
+            "description": "Educational background and qualifications"
+        },
+        {
+            "name": "skills",
+            "display_name": "Skills",
+            "required": False,
+            "format": "## Skills",
+            "min_length": 10,
+            "description": "Technical and professional skills relevant to the role"
+        }
+    ],
+    "placeholders": {
+        "name": "Full name from contact information",
+        "contact_info": "Contact details (email, phone, location)"
+    }
+}
+
+_DEFAULT_TEMPLATE_BYTES: Final[bytes] = _DEFAULT_TEMPLATE.encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _default_template_schema_yaml() -> bytes:
+    """YAML encoding of the default schema, dumped once per process."""
+    import yaml
+    return yaml.dump(_DEFAULT_TEMPLATE_SCHEMA, default_flow_style=False).encode("utf-8")
+
+
+# Parsed config/template/background keyed by the (mtime_ns, size) of their source files
+_LOAD_CACHE: dict[tuple, tuple[tuple, Any]] = {}
+
+
+def _make_profile_dirs(profile_dir: str) -> None:
+    """Create the profile directory and its subdirectories, walking the parent chain once."""
+    os.makedirs(profile_dir, exist_ok=True)
+    for name in _PROFILE_SUBDIRS:
+        try:
+            os.mkdir(os.path.join(profile_dir, name))
+        except FileExistsError:
+            pass
+
+
+def _stat_stamp(paths: tuple[Path, ...]) -> tuple:
+    """Return a change stamp for the given files (None for missing files)."""
+    stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _cached_load(key: tuple, paths: tuple[Path, ...], loader):
+    """Return a copy of the cached model for key, reloading when any source file changed."""
+    cached = _LOAD_CACHE.get(key)
+    stamp = _stat_stamp(paths)
+    if cached is None or cached[0] != stamp:
+        # Stamp before loading: a file rewritten mid-load then no longer matches and reloads next time
+        value = loader()
+        if None in stamp:
+            # Files the loader created from defaults count as seen; everything else keeps its pre-load stamp
+            after = _stat_stamp(paths)
+            stamp = tuple(new if before is None else before for before, new in zip(stamp, after))
+        cached = _LOAD_CACHE[key] = (stamp, value)
+    # Callers mutate what they get back (e.g. config.current_profile), so hand out copies
+    return cached[1].model_copy(deep=True)
 
 
 class FileSystemService:
@@ -28,37 +155,27 @@ class FileSystemService:
         self.workspace_path = workspace_path
         self.current_profile = profile_name
         self.data_path = self.fs.data_path
-        self.profile_path = self.fs.profile_path
+        self._set_profile_paths()
         
         self._ensure_workspace_structure()
         
         # Auto-initialize if not already initialized
         if not self.is_initialized():
-            from .models import PineneedleConfig
             config = PineneedleConfig.load()  # This creates default config if none exists
             self.initialize_workspace(config, output_callback=lambda x: None)  # Silent initialization
     
+    def _set_profile_paths(self) -> None:
+        """Cache the current profile's directory paths so callers don't rebuild them."""
+        self.profile_path = self.fs.profile_path
+        self.background_path = self.profile_path / "background"
+        self.templates_path = self.profile_path / "templates"
+        self.job_postings_path = self.profile_path / "job_postings"
+        self.resumes_path = self.profile_path / "resumes"
+    
     def _ensure_workspace_structure(self) -> None:
         """Create necessary directories if they don't exist."""
-        # Create main data directory
-        self.fs.ensure_directory(self.data_path)
-        
-        # Create profiles directory
-        self.fs.ensure_directory(self.data_path / "profiles")
-        
-        # Create current profile directory
-        self.fs.ensure_directory(self.profile_path)
-        
-        # Create profile-specific directories
-        directories = [
-            "background",
-            "templates", 
-            "job_postings",
-            "resumes",
-        ]
-        
-        for dir_name in directories:
-            self.fs.ensure_directory(self.profile_path / dir_name)
+        # Data dir, profiles dir and current profile in one makedirs, then the flat subdirectories
+        _make_profile_dirs(str(self.profile_path))
         
         # Ensure profile config exists
         self._ensure_profile_config()
@@ -77,9 +194,9 @@ class FileSystemService:
     def load_profile_config(self) -> ProfileConfig:
         """Load the current profile's configuration."""
         config_path = self.fs.get_profile_path("config.json")
-        data = self.fs.read_json(config_path)
-        if data:
-            return ProfileConfig.model_validate(data)
+        content = self.fs.read_bytes_safe(config_path)
+        if content:
+            return ProfileConfig.model_validate_json(content)
         else:
             # Return default if not found
             return ProfileConfig.create_default(
@@ -89,14 +206,13 @@ class FileSystemService:
     def save_profile_config(self, config: ProfileConfig) -> None:
         """Save the current profile's configuration."""
         config_path = self.fs.get_profile_path("config.json")
-        data = config.model_dump()
-        self.fs.write_json(config_path, data)
+        self.fs.write_bytes(config_path, model_json_bytes(config))
     
     def switch_profile(self, profile_name: str) -> None:
         """Switch to a different profile."""
         self.current_profile = profile_name
         self.fs.switch_profile(profile_name)
-        self.profile_path = self.fs.profile_path
+        self._set_profile_paths()
         self._ensure_workspace_structure()
     
     def create_profile(self, name: str, display_name: str, description: str = "") -> ProfileInfo:
@@ -108,31 +224,20 @@ class FileSystemService:
             description=description
         )
         
-        # Create profile directory
+        # Create profile directory and subdirectories
         profile_dir = self.data_path / "profiles" / name
-        profile_dir.mkdir(exist_ok=True)
-        
-        # Create subdirectories
-        directories = ["background", "templates", "job_postings", "resumes"]
-        for dir_name in directories:
-            (profile_dir / dir_name).mkdir(exist_ok=True)
+        _make_profile_dirs(str(profile_dir))
         
         # Copy example data to background if it doesn't exist
         background_path = profile_dir / "background"
         example_data_path = self.workspace_path / "example_data"
         
-        if example_data_path.exists():
-            for file_name in ["contact.md", "education.md", "experience.md", "reference.md"]:
-                example_file = example_data_path / file_name
-                background_file = background_path / file_name
-                
-                if example_file.exists() and not background_file.exists():
-                    background_file.write_text(example_file.read_text())
+        self._copy_example_data(example_data_path, background_path)
         
         # Create profile config
-        profile_config = ProfileConfig.create_default(display_name, description)
+        profile_config = ProfileConfig.create_default(display_name, description, profile_info.created_at)
         config_path = profile_dir / "config.json"
-        config_path.write_text(profile_config.model_dump_json(indent=2), encoding="utf-8")
+        write_bytes_atomic(config_path, model_json_bytes(profile_config))
         
         return profile_info
     
@@ -158,7 +263,7 @@ class FileSystemService:
             self.data_path.exists() and
             (self.data_path / "config.json").exists() and
             self.profile_path.exists() and
-            (self.profile_path / "background").exists() and
+            self.background_path.exists() and
             (self.profile_path / "config.json").exists()
         )
     
@@ -176,12 +281,7 @@ class FileSystemService:
         job_count = len(self.list_job_postings())
         
         # Count resumes across all jobs
-        resume_count = 0
-        resumes_path = self.profile_path / "resumes"
-        if resumes_path.exists():
-            for job_dir in resumes_path.iterdir():
-                if job_dir.is_dir():
-                    resume_count += len(self.list_resume_versions(job_dir.name))
+        resume_count = sum(len(versions) for _, versions in self.enumerate_resumes())
         
         # Check if user has background information
         background = self.load_user_background()
@@ -202,8 +302,12 @@ class FileSystemService:
     
     def load_user_background(self) -> UserBackground:
         """Load user background markdown files."""
-        background_path = self.profile_path / "background"
-        
+        background_path = self.background_path
+        paths = tuple(background_path / name for name in ("experience.md", "education.md", "contact.md", "reference.md"))
+        return _cached_load(("background", background_path), paths, lambda: self._load_user_background(background_path))
+    
+    def _load_user_background(self, background_path: Path) -> UserBackground:
+        """Read user background markdown files from disk."""
         experience_md = self._read_file_safe(background_path / "experience.md")
         education_md = self._read_file_safe(background_path / "education.md")
         contact_md = self._read_file_safe(background_path / "contact.md")
@@ -222,29 +326,36 @@ class FileSystemService:
     
     def load_template(self, template_name: str = "default"):
         """Load complete template with schema."""
-        from .models import Template, TemplateSchema
+        template_path = self.templates_path / f"{template_name}.md"
+        schema_path = self.templates_path / f"{template_name}.yaml"
+        return _cached_load(("template", template_path), (template_path, schema_path), lambda: self._load_template(template_name))
+    
+    def _load_template(self, template_name: str):
+        """Read template and schema from disk, creating defaults if missing."""
         import yaml
         
         # Load template content
-        template_path = self.fs.get_profile_path("templates", f"{template_name}.md")
-        schema_path = self.fs.get_profile_path("templates", f"{template_name}.yaml")
+        template_path = self.templates_path / f"{template_name}.md"
+        schema_path = self.templates_path / f"{template_name}.yaml"
         
         content = self.fs.read_text_safe(template_path)
         if not content:
             # Create default template and schema if they don't exist
-            content = self._get_default_template()
-            self.fs.write_text(template_path, content)
-            
-            default_schema = self._get_default_template_schema()
-            self.fs.write_text(schema_path, yaml.dump(default_schema, default_flow_style=False))
-        
-        # Load schema
-        schema_content = self.fs.read_text_safe(schema_path)
+            content = _DEFAULT_TEMPLATE
+            self.fs.ensure_directory(self.templates_path)
+            write_bytes_atomic(template_path, _DEFAULT_TEMPLATE_BYTES)
+            write_bytes_atomic(schema_path, _default_template_schema_yaml())
+            # Just written from the defaults, no need to read it back
+            schema_content = ""
+        else:
+            schema_content = self.fs.read_text_safe(schema_path)
+            if not schema_content:
+                # Create default schema if it doesn't exist
+                self.fs.ensure_directory(self.templates_path)
+                write_bytes_atomic(schema_path, _default_template_schema_yaml())
+        
         if not schema_content:
-            # Create default schema if it doesn't exist
-            default_schema = self._get_default_template_schema()
-            self.fs.write_text(schema_path, yaml.dump(default_schema, default_flow_style=False))
-            schema_data = default_schema
+            schema_data = _DEFAULT_TEMPLATE_SCHEMA
         else:
             schema_data = yaml.safe_load(schema_content)
         
@@ -256,107 +367,67 @@ class FileSystemService:
             template_schema=schema
         )
     
-    def _get_default_template(self) -> str:
-        """Return the default resume template."""
-        return """# {name}
-{contact_info}
-
-## Summary
-{summary}
-
-## Experience
-{experience}
-
-## Education
-{education}
-
-## Skills
-{skills}
-"""
-    
-    def _get_default_template_schema(self) -> dict:
-        """Return the default template schema."""
-        return {
-            "name": "default",
-            "description": "Standard resume template with essential sections",
-            "sections": [
-                {
-                    "name": "summary",
-                    "display_name": "Summary",
-                    "required": True,
-                    "format": "## Summary",
-                    "min_length": 20,
-                    "description": "Professional summary highlighting key qualifications and experience"
-                },
-                {
-                    "name": "experience",
-                    "display_name": "Experience", 
-                    "required": True,
-                    "format": "## Experience",
-                    "min_length": 50,
-                    "description": "Work experience and professional achievements"
-                },
-                {
-                    "name": "education",
-                    "display_name": "Education",
-                    "required": True,
-                    "format": "## Education", 
-                    "min_length": 20,
-                    "description": "Educational background and qualifications"
-                },
-                {
-                    "name": "skills",
-                    "display_name": "Skills",
-                    "required": False,
-                    "format": "## Skills",
-                    "min_length": 10,
-                    "description": "Technical and professional skills relevant to the role"
-                }
-            ],
-            "placeholders": {
-                "name": "Full name from contact information",
-                "contact_info": "Contact details (email, phone, location)"
-            }
-        }
-    
     def save_job_posting(self, posting: JobPosting) -> str:
         """Save job posting and return its ID."""
         filename = generate_job_posting_filename(posting)
-        posting_path = self.fs.get_profile_path("job_postings", filename)
-        content = posting.model_dump_json(indent=2)
-        self.fs.write_text(posting_path, content)
+        posting_path = self.job_postings_path / filename
+        self.fs.write_bytes(posting_path, model_json_bytes(posting))
         
         return posting.id
     
+    def find_job_posting_file(self, job_id: str) -> str | None:
+        """Return the path of the posting file for job_id, or None if there is none."""
+        # Plain scandir name checks rather than glob, which builds a Path per entry
+        prefix = f"{job_id}_"
+        try:
+            with os.scandir(self.job_postings_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(".json"):
+                        return entry.path
+        except FileNotFoundError:
+            pass
+        return None
+    
     def load_job_posting(self, job_id: str) -> JobPosting:
         """Load job posting by ID."""
-        job_postings_path = self.fs.get_profile_path("job_postings")
-        
-        # Search for files that start with the job_id
-        matching_files = list(job_postings_path.glob(f"{job_id}_*.json"))
-        if not matching_files:
+        # Search for the file that starts with the job_id (should be unique)
+        posting_path = self.find_job_posting_file(job_id)
+        if posting_path is None:
             raise FileNotFoundError(f"Job posting {job_id} not found")
         
-        # Use the first match (should be unique)
-        posting_path = matching_files[0]
-        data = self.fs.read_json(posting_path)
-        return JobPosting.model_validate(data)
+        return JobPosting.model_validate_json(read_bytes_fast(posting_path))
     
     def list_job_postings(self) -> list[JobPosting]:
         """List all job postings, sorted chronologically (newest first)."""
-        job_postings_path = self.fs.get_profile_path("job_postings")
-        postings = []
+        try:
+            with os.scandir(self.job_postings_path) as entries:
+                # entry.path is the directory string plus the name, so no Path is built per file
+                posting_files = [entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+        except FileNotFoundError:
+            return []
+        if not posting_files:
+            return []
+        
+        # Filenames start with the timestamp ID and share the directory prefix, so path order is chronological
+        posting_files.sort(reverse=True)
+        
+        def read_posting(path: str) -> bytes:
+            try:
+                return read_bytes_fast(path)
+            except OSError:
+                return b""  # Unreadable files are skipped like corrupted ones
         
-        # Get all json files and sort by filename for chronological order
-        posting_files = sorted(job_postings_path.glob("*.json"), reverse=True)
+        # Reads are latency-bound on network/FUSE mounts, so overlap them
+        with ThreadPoolExecutor(max_workers=min(16, len(posting_files))) as pool:
+            contents = list(pool.map(read_posting, posting_files))
         
-        for posting_file in posting_files:
+        postings = []
+        for content in contents:
+            if not content:
+                continue
             try:
-                data = self.fs.read_json(posting_file)
-                if not data:
-                    continue
-                posting = JobPosting.model_validate(data)
-                postings.append(posting)
+                postings.append(JobPosting.model_validate_json(content))
             except Exception:
                 continue  # Skip corrupted files
                 
@@ -366,10 +437,14 @@ class FileSystemService:
         self,
         job_posting_id: str,
         resume_content: ResumeContent,
+        job_posting: JobPosting | None = None,
     ) -> Path:
-        """Save a generated resume with timestamp."""
+        """Save a generated resume with timestamp.
+        
+        Passing the job posting also refreshes the directory's listing index.
+        """
         # Create resume directory
-        resume_dir = self.fs.get_profile_path("resumes", job_posting_id)
+        resume_dir = self.resumes_path / job_posting_id
         self.fs.ensure_directory(resume_dir)
         
         # Save resume content with timestamp
@@ -377,31 +452,92 @@ class FileSystemService:
         content_path = resume_dir / filename
         self.fs.write_text(content_path, resume_content.resume_markdown)
         
+        if job_posting is not None:
+            self._write_resume_index(resume_dir, job_posting)
+        
         return content_path
     
+    def _write_resume_index(self, resume_dir: Path, job_posting: JobPosting) -> dict[str, str]:
+        """Write the small index.json that resume listings read instead of the job posting."""
+        index = {"title": job_posting.title, "company": job_posting.company}
+        self.fs.write_json(resume_dir / "index.json", index)
+        return index
+    
+    def load_resume_index(self, job_id: str) -> dict[str, str]:
+        """Load the title/company for a job's saved resumes.
+        
+        Falls back to the full job posting (and backfills index.json) for resume
+        directories written before the index existed. Raises FileNotFoundError if
+        neither is available.
+        """
+        resume_dir = self.resumes_path / job_id
+        try:
+            index = self.fs.read_json(resume_dir / "index.json")
+        except ValueError:
+            index = {}  # Corrupt index, rebuild it below
+        if "title" in index and "company" in index:
+            return index
+        
+        return self._write_resume_index(resume_dir, self.load_job_posting(job_id))
+    
     def load_config(self) -> PineneedleConfig:
         """Load application configuration."""
         config_path = self.fs.get_data_path("config.json")
-        return PineneedleConfig.load(config_path)
+        return _cached_load(("config", config_path), (config_path,), lambda: PineneedleConfig.load(config_path))
     
     def save_config(self, config: PineneedleConfig) -> None:
         """Save application configuration."""
         config_path = self.fs.get_data_path("config.json")
-        content = config.model_dump_json(indent=2)
-        self.fs.write_text(config_path, content)
+        self.fs.write_bytes(config_path, model_json_bytes(config))
+        _LOAD_CACHE.pop(("config", config_path), None)
 
     def list_resume_versions(self, job_id: str) -> list[tuple[str, Path]]:
         """List all resume versions for a job posting with timestamps."""
-        resume_dir = self.fs.get_profile_path("resumes", job_id)
+        resume_dir = self.resumes_path / job_id
         
-        versions = []
-        for resume_file in resume_dir.glob("*_resume.md"):
-            timestamp = parse_timestamp_from_resume_filename(resume_file.name)
-            versions.append((timestamp, resume_file))
+        try:
+            with os.scandir(resume_dir) as entries:
+                names = [entry.name for entry in entries if entry.name.endswith("_resume.md")]
+        except FileNotFoundError:
+            return []
+        
+        # Timestamped names sort chronologically, so sort by name (newest first)
+        names.sort(reverse=True)
+        return [(parse_timestamp_from_resume_filename(name), resume_dir / name) for name in names]
+    
+    @staticmethod
+    def _copy_example_data(example_data_path: Path, background_path: Path) -> list[str]:
+        """Copy example background files that the profile doesn't have yet.
         
-        # Sort by timestamp (newest first)
-        versions.sort(key=lambda x: x[0], reverse=True)
-        return versions
+        Returns the names of the files that were copied.
+        """
+        try:
+            with os.scandir(example_data_path) as entries:
+                available = {entry.name: entry.path for entry in entries if entry.name in _EXAMPLE_BACKGROUND_FILES}
+        except FileNotFoundError:
+            return []
+        
+        copied = []
+        for file_name in _EXAMPLE_BACKGROUND_FILES:
+            if file_name in available and not os.path.exists(background_path / file_name):
+                shutil.copyfile(available[file_name], background_path / file_name)
+                copied.append(file_name)
+        return copied
+    
+    def enumerate_resumes(self) -> list[tuple[str, list[tuple[str, Path]]]]:
+        """List (job_id, versions) for every job with saved resumes in one walk of resumes/."""
+        try:
+            with os.scandir(self.resumes_path) as entries:
+                job_ids = [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+        
+        resumes = []
+        for job_id in job_ids:
+            versions = self.list_resume_versions(job_id)
+            if versions:
+                resumes.append((job_id, versions))
+        return resumes
     
     def initialize_workspace(self, config: Any, output_callback=None) -> None:
         """Initialize the pineneedle workspace with example data and configuration.
@@ -417,17 +553,10 @@ class FileSystemService:
         output_callback("✓ Created directory structure")
         
         # Copy example data to background if it doesn't exist
-        background_path = self.profile_path / "background"
         example_data_path = self.workspace_path / "example_data"
         
-        if example_data_path.exists():
-            for file_name in ["contact.md", "education.md", "experience.md", "reference.md"]:
-                example_file = example_data_path / file_name
-                background_file = background_path / file_name
-                
-                if example_file.exists() and not background_file.exists():
-                    background_file.write_text(example_file.read_text())
-                    output_callback(f"✓ Copied {file_name} to background/")
+        for file_name in self._copy_example_data(example_data_path, self.background_path):
+            output_callback(f"✓ Copied {file_name} to background/")
         
         # Create default template with schema
         template = self.load_template("default")
@@ -451,7 +580,7 @@ class FileSystemService:
         if timestamp is None:
             return self.get_latest_resume_path(job_id)
         
-        resume_dir = self.fs.get_profile_path("resumes", job_id)
+        resume_dir = self.resumes_path / job_id
         filename = generate_resume_filename(datetime.strptime(timestamp, "%Y-%m-%d_%H-%M-%S"))
         version_path = resume_dir / filename
         
@@ -467,19 +596,15 @@ class PDFMetadataService:
     
     def load_metadata(self) -> PDFMetadata:
         """Load PDF metadata from JSON file."""
-        if self.metadata_file.exists():
-            try:
-                import json
-                data = json.loads(self.metadata_file.read_text())
-                return PDFMetadata.model_validate(data)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return PDFMetadata()
-        return PDFMetadata()
+        try:
+            return PDFMetadata.model_validate_json(read_bytes_fast(self.metadata_file))
+        except (ValidationError, FileNotFoundError):
+            return PDFMetadata()
     
     def save_metadata(self, metadata: PDFMetadata) -> None:
         """Save PDF metadata to JSON file."""
         self.resume_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata_file.write_text(metadata.model_dump_json(indent=2))
+        write_bytes_atomic(self.metadata_file, model_json_bytes(metadata))
     
     def is_pdf_generated(self, resume_filename: str, template: str) -> bool:
         """Check if PDF was already generated for this resume and template."""
@@ -490,31 +615,33 @@ class PDFMetadataService:
     def get_pdf_path(self, resume_filename: str, template: str) -> Path | None:
         """Get path to existing PDF if it exists."""
         if self.is_pdf_generated(resume_filename, template):
-            from .filename_utils import generate_pdf_filename_from_resume
             pdf_filename = generate_pdf_filename_from_resume(resume_filename, template)
             pdf_path = self.resume_dir / pdf_filename
             if pdf_path.exists():
                 return pdf_path
         return None
     
-    def record_pdf_generation(self, resume_filename: str, template: str, pdf_path: Path) -> None:
-        """Record that a PDF was generated."""
-        from datetime import datetime
-        from .filename_utils import generate_pdf_filename_from_resume
-        
+    def record_pdf_generation(self, resume_filename: str, template: str, pdf_path: Path) -> PDFGenerationRecord:
+        """Record that a PDF was generated and return the stored record."""
         metadata = self.load_metadata()
         key = f"{resume_filename}_{template}"
         
+        try:
+            file_size = pdf_path.stat().st_size
+        except FileNotFoundError:
+            file_size = 0
+        
         record = PDFGenerationRecord(
             resume_file=resume_filename,
             template=template,
             pdf_file=pdf_path.name,
             generated_at=datetime.now().isoformat(),
-            file_size=pdf_path.stat().st_size if pdf_path.exists() else 0
+            file_size=file_size
         )
         
         metadata.records[key] = record
         self.save_metadata(metadata)
+        return record
     
     def list_generated_pdfs(self) -> list[PDFGenerationRecord]:
         """List all generated PDFs with their metadata."""
@@ -1,13 +1,13 @@
 """Manager classes for handling specific TUI domains."""
 
-import asyncio
 import click
 import os
 from pathlib import Path
 from typing import Optional
 
 from .base import MenuController, ListSelector, select_with_back, BACK_SIGNAL
-from ..agents import parse_job_posting, generate_resume
+from ..agents import parse_job_posting, generate_resume, run_sync
+from ..file_operations import read_bytes_fast
 from ..models import ResumeDeps
 
 
@@ -124,13 +124,13 @@ class JobManager(MenuController):
         """Delete a job posting."""
         if self.confirm_action(f"Delete job posting '{posting.title}' at {posting.company}? This cannot be undone."):
             # Delete the posting file
-            job_postings_path = self.fs.profile_path / "job_postings"
+            job_postings_path = self.fs.job_postings_path
             
             # Find and delete the posting file
-            for file_path in job_postings_path.glob(f"{posting.id}_*.json"):
+            file_path = self.fs.find_job_posting_file(posting.id)
+            if file_path is not None:
                 os.remove(file_path)
                 self.show_success(f"Deleted job posting: {posting.title}")
-                break
             else:
                 # Fallback: try exact match
                 exact_path = job_postings_path / f"{posting.id}.json"
@@ -162,10 +162,10 @@ class JobManager(MenuController):
             
             # Generate resume
             click.echo("Generating resume...")
-            resume_content = asyncio.run(generate_resume(deps, self.config.default_model))
+            resume_content = run_sync(generate_resume(deps, self.config.default_model))
             
             # Save resume
-            self.fs.save_resume(job_posting.id, resume_content)
+            self.fs.save_resume(job_posting.id, resume_content, job_posting)
             self.show_success("Resume generated and saved!")
             
             # Show options
@@ -245,7 +245,7 @@ class JobManager(MenuController):
         
         try:
             click.echo("\nParsing job posting...")
-            posting = asyncio.run(parse_job_posting(content, self.config.default_model))
+            posting = run_sync(parse_job_posting(content, self.config.default_model))
             click.echo("✓ Parsing complete!")
             
             # Show parsed details for confirmation
@@ -284,13 +284,13 @@ class JobManager(MenuController):
             return
         
         try:
-            content = file_path_obj.read_text().strip()
+            content = file_path_obj.read_bytes().decode("utf-8").strip()
             if not content:
                 self.show_error("File is empty")
                 return
             
             click.echo("Parsing job posting...")
-            posting = asyncio.run(parse_job_posting(content, self.config.default_model))
+            posting = run_sync(parse_job_posting(content, self.config.default_model))
             
             # Show parsed details for confirmation
             self._show_parsed_job_summary(posting)
@@ -353,47 +353,31 @@ class ResumeManager(MenuController):
     
     def delete_resume_interactive(self) -> None:
         """Interactive resume deletion."""
-        resumes_path = self.fs.profile_path / "resumes"
-        
-        if not resumes_path.exists():
-            click.echo("No saved resumes found")
-            self.wait_for_user()
-            return
-        
-        resume_dirs = [d for d in resumes_path.iterdir() if d.is_dir()]
-        if not resume_dirs:
+        resumes = self.fs.enumerate_resumes()
+        if not resumes:
             click.echo("No saved resumes found")
             self.wait_for_user()
             return
         
         # Create list of available resumes
         resume_options = []
-        for resume_dir in resume_dirs:
-            job_id = resume_dir.name
-            versions = self.fs.list_resume_versions(job_id)
+        for job_id, versions in resumes:
+            # Get job title from the resume index if available
+            try:
+                index = self.fs.load_resume_index(job_id)
+                title = index["title"]
+                company = index["company"]
+            except:
+                title = "Unknown Job"
+                company = "Unknown Company"
             
-            if versions:
-                # Get job title from posting if available
-                try:
-                    job_posting = self.fs.load_job_posting(job_id)
-                    title = job_posting.title
-                    company = job_posting.company
-                except:
-                    title = "Unknown Job"
-                    company = "Unknown Company"
-                
-                resume_options.append({
-                    'job_id': job_id,
-                    'title': title,
-                    'company': company,
-                    'versions': versions,
-                    'display': f"{title} at {company} ({len(versions)} version{'s' if len(versions) != 1 else ''})"
-                })
-        
-        if not resume_options:
-            click.echo("No resumes with versions found")
-            self.wait_for_user()
-            return
+            resume_options.append({
+                'job_id': job_id,
+                'title': title,
+                'company': company,
+                'versions': versions,
+                'display': f"{title} at {company} ({len(versions)} version{'s' if len(versions) != 1 else ''})"
+            })
         
         # Select which resume to delete
         selected_resume = ListSelector.select_from_list(
@@ -439,7 +423,7 @@ class ResumeManager(MenuController):
         
         if self.confirm_action(confirm_msg):
             try:
-                resume_dir = self.fs.profile_path / "resumes" / resume_info['job_id']
+                resume_dir = self.fs.resumes_path / resume_info['job_id']
                 resume_file = resume_dir / filename
                 
                 if resume_file.exists():
@@ -470,7 +454,7 @@ class ResumeManager(MenuController):
         if self.confirm_action(confirm_msg):
             try:
                 import shutil
-                resume_dir = self.fs.profile_path / "resumes" / resume_info['job_id']
+                resume_dir = self.fs.resumes_path / resume_info['job_id']
                 
                 if resume_dir.exists():
                     shutil.rmtree(resume_dir)
@@ -482,46 +466,34 @@ class ResumeManager(MenuController):
     
     def show_saved_resumes(self) -> None:
         """Show all saved resumes (read-only display)."""
-        resumes_path = self.fs.profile_path / "resumes"
-        
-        if not resumes_path.exists():
-            click.echo("No saved resumes found")
-            self.wait_for_user()
-            return
-        
-        resume_dirs = [d for d in resumes_path.iterdir() if d.is_dir()]
-        if not resume_dirs:
+        resumes = self.fs.enumerate_resumes()
+        if not resumes:
             click.echo("No saved resumes found")
             self.wait_for_user()
             return
         
         click.echo(f"\nSaved Resumes")
-        click.echo(f"Found resumes for {len(resume_dirs)} job(s):\n")
+        click.echo(f"Found resumes for {len(resumes)} job(s):\n")
         
-        for resume_dir in resume_dirs:
-            job_id = resume_dir.name
-            versions = self.fs.list_resume_versions(job_id)
+        for job_id, versions in resumes:
+            # Get job title from the resume index if available
+            try:
+                index = self.fs.load_resume_index(job_id)
+                title = index["title"]
+                company = index["company"]
+            except:
+                title = "Unknown Job"
+                company = "Unknown Company"
             
-            if versions:
-                # Get job title from posting if available
-                try:
-                    job_posting = self.fs.load_job_posting(job_id)
-                    title = job_posting.title
-                    company = job_posting.company
-                except:
-                    title = "Unknown Job"
-                    company = "Unknown Company"
-                
-                click.echo(f"Job ID: {job_id}")
-                click.echo(f"Title: {title}")
-                click.echo(f"Company: {company}")
-                click.echo(f"Resume versions: {len(versions)}")
-                if versions:
-                    latest_timestamp = versions[0][0]
-                    click.echo(f"Latest: {latest_timestamp}")
-                    if len(versions) > 1:
-                        click.echo(f"Other versions: {', '.join([v[0] for v in versions[1:]])}")
-                click.echo("-" * 40)
+            click.echo(f"Job ID: {job_id}")
+            click.echo(f"Title: {title}")
+            click.echo(f"Company: {company}")
+            click.echo(f"Resume versions: {len(versions)}")
+            latest_timestamp = versions[0][0]
+            click.echo(f"Latest: {latest_timestamp}")
+            if len(versions) > 1:
+                click.echo(f"Other versions: {', '.join([v[0] for v in versions[1:]])}")
+            click.echo("-" * 40)
         
         self.wait_for_user()
 
@@ -563,8 +535,7 @@ class ExportManager(MenuController):
         
         # Get templates
         from ..pdf import PDFGenerator
-        pdf_gen = PDFGenerator()
-        templates = pdf_gen.get_available_templates()
+        templates = PDFGenerator.get_available_templates()
         
         template = select_with_back(
             "Choose PDF template:",
@@ -577,15 +548,14 @@ class ExportManager(MenuController):
         
         # Export to PDF with filename matching resume markdown
         resume_path = self.fs.get_resume_version(job_id)
-        if not resume_path or not resume_path.exists():
+        if not resume_path:
             self.show_error(f"No resume found for job ID: {job_id}")
             return
             
         # Get resume directory and setup metadata tracking
         from ..filename_utils import generate_pdf_filename_from_resume
         from ..services import PDFMetadataService
-        resume_dir = self.fs.fs.get_profile_path("resumes", job_id)
-        self.fs.fs.ensure_directory(resume_dir)  # Make sure directory exists
+        resume_dir = resume_path.parent  # Exists, since resume_path was found in it
         pdf_metadata = PDFMetadataService(resume_dir)
         
         # Generate filename based on resume markdown name
@@ -595,7 +565,7 @@ class ExportManager(MenuController):
         
         # Check if PDF already exists
         existing_pdf = pdf_metadata.get_pdf_path(resume_filename, template)
-        if existing_pdf and existing_pdf.exists():
+        if existing_pdf:
             click.echo(f"PDF already exists: {existing_pdf}")
             if not self.confirm_action("Do you want to regenerate it?", default=False):
                 click.echo(f"✓ Using existing PDF: {existing_pdf}")
@@ -608,40 +578,41 @@ class ExportManager(MenuController):
     def _export_resume_to_pdf(self, job_id: str, template: str, output: str, pdf_metadata=None, resume_filename: str = None) -> None:
         """Export a resume to PDF."""
         from pathlib import Path
-        from ..pdf import PDFGenerator
+        from ..pdf import PDFGenerator, get_pdf_generator
         
         # Load the resume content
         resume_path = self.fs.get_resume_version(job_id)
         
-        if not resume_path or not resume_path.exists():
+        if not resume_path:
             self.show_error(f"No resume found for job ID: {job_id}")
             return
         
-        # Create PDF generator
-        pdf_gen = PDFGenerator()
-        
-        # Check if template is valid
-        available_templates = pdf_gen.get_available_templates()
+        # Check if template is valid before building the generator
+        available_templates = PDFGenerator.get_available_templates()
         if template not in available_templates:
             self.show_error(f"Invalid template '{template}'. Available: {', '.join(available_templates)}")
             return
         
+        pdf_gen = get_pdf_generator()
+        
         output_path = Path(output)
         
         try:
             # Read resume content
-            resume_content = resume_path.read_text()
+            resume_content = read_bytes_fast(resume_path).decode("utf-8")
             
             # Generate PDF
             click.echo(f"Generating PDF with '{template}' template...")
             pdf_path = pdf_gen.generate(resume_content, output_path, template)
             
-            # Record PDF generation in metadata if provided
+            # Record PDF generation in metadata if provided; the record carries the size
             if pdf_metadata and resume_filename:
-                pdf_metadata.record_pdf_generation(resume_filename, template, pdf_path)
+                file_size = pdf_metadata.record_pdf_generation(resume_filename, template, pdf_path).file_size
+            else:
+                file_size = pdf_path.stat().st_size
             
             click.echo(f"PDF exported to: {pdf_path}")
-            click.echo(f"File size: {pdf_path.stat().st_size:,} bytes")
+            click.echo(f"File size: {file_size:,} bytes")
             
         except Exception as e:
             self.show_error(f"Error generating PDF: {e}")
\ No newline at end of file